@@ -7,9 +7,17 @@ Run with:
 
 from __future__ import annotations
 
+import os
+
+import matplotlib
 import streamlit as st
 
-from src.pipeline import price_option_monte_carlo
+# Figures are only rendered to images (st.pyplot), so skip GUI backend
+# initialization unless a backend is chosen explicitly
+if "MPLBACKEND" not in os.environ:
+    matplotlib.use("Agg")
+
+from src.pipeline import OptionPricingResults, price_option_monte_carlo
 from src.visualizations import (
     plot_payoff_distribution,
     plot_price_paths,
@@ -17,6 +25,32 @@ from src.visualizations import (
 )
 
 
+@st.cache_data(max_entries=32, show_spinner=False)
+def cached_price_option_monte_carlo(
+    spot_price: float,
+    strike_price: float,
+    time_to_expiration: float,
+    risk_free_rate: float,
+    volatility: float,
+    option_type: str,
+    num_simulations: int,
+    num_steps: int,
+    use_qmc: bool,
+) -> OptionPricingResults:
+    """Run the pricing pipeline, replaying cached results for repeated inputs."""
+    return price_option_monte_carlo(
+        spot_price=spot_price,
+        strike_price=strike_price,
+        time_to_expiration=time_to_expiration,
+        risk_free_rate=risk_free_rate,
+        volatility=volatility,
+        option_type=option_type,
+        num_simulations=num_simulations,
+        num_steps=num_steps,
+        use_qmc=use_qmc,
+    )
+
+
 def main() -> None:
     st.title("Monte Carlo Options Pricing Simulator")
     
@@ -108,6 +142,13 @@ Monte Carlo is particularly useful for complex derivatives where closed-form sol
             help="Number of steps to discretize each price path",
         )
         
+        use_qmc = st.checkbox(
+            "Quasi-Monte Carlo (Sobol)",
+            value=False,
+            help="Use a scrambled Sobol sequence for faster convergence than pseudo-random "
+            "sampling; the number of simulations is rounded up to a power of two",
+        )
+        
         calculate_button = st.button("Calculate Option Price", type="primary")
     
     if not calculate_button:
@@ -117,7 +158,7 @@ Monte Carlo is particularly useful for complex derivatives where closed-form sol
     # Run simulation
     with st.spinner("Running Monte Carlo simulation..."):
         try:
-            results = price_option_monte_carlo(
+            results = cached_price_option_monte_carlo(
                 spot_price=spot_price,
                 strike_price=strike_price,
                 time_to_expiration=time_to_expiration,
@@ -126,13 +167,14 @@ Monte Carlo is particularly useful for complex derivatives where closed-form sol
                 option_type=option_type,
                 num_simulations=int(num_simulations),
                 num_steps=int(num_steps),
+                use_qmc=use_qmc,
             )
         except Exception as exc:
             st.error(f"Error during simulation: {exc}")
             return
     
     # Display results
-    st.success(f"✅ Simulation complete with {int(num_simulations):,} paths!")
+    st.success(f"✅ Simulation complete with {results.num_simulations:,} paths!")
     
     # Price comparison
     st.subheader("Option Pricing Results")
@@ -154,9 +196,12 @@ Monte Carlo is particularly useful for complex derivatives where closed-form sol
         help="Percentage difference between methods",
     )
     
-    # Confidence interval
-    st.write(f"**95% Confidence Interval:** [${results.mc_ci_lower:.4f}, ${results.mc_ci_upper:.4f}]")
-    st.write(f"**Standard Error:** ${results.mc_std_error:.4f}")
+    # Confidence interval (an i.i.d. estimate, not valid for a single Sobol sequence)
+    if results.use_qmc:
+        st.write("**Standard Error:** n/a for quasi-Monte Carlo (Sobol) sampling")
+    else:
+        st.write(f"**95% Confidence Interval:** [${results.mc_ci_lower:.4f}, ${results.mc_ci_upper:.4f}]")
+        st.write(f"**Standard Error:** ${results.mc_std_error:.4f}")
     
     # Interpretation
     st.subheader("Interpretation")
@@ -176,18 +221,18 @@ Monte Carlo is particularly useful for complex derivatives where closed-form sol
     # Visualizations
     st.subheader("Simulated Stock Price Paths")
     fig1 = plot_price_paths(
-        results.mc_price_paths,
+        results.mc_sample_paths,
         results.spot_price,
         results.strike_price,
         results.time_to_expiration,
-        num_paths_to_plot=min(100, int(num_simulations)),
+        num_paths_to_plot=len(results.mc_sample_paths),
     )
     st.pyplot(fig1)
     st.caption("Sample of simulated price paths showing possible stock price evolution over time.")
     
     st.subheader("Terminal Stock Price Distribution")
     fig2 = plot_terminal_price_distribution(
-        results.mc_price_paths,
+        results.mc_terminal_prices,
         results.strike_price,
         option_type,
     )
@@ -208,7 +253,7 @@ Monte Carlo is particularly useful for complex derivatives where closed-form sol
     st.subheader("Simulation Statistics")
     col1, col2 = st.columns(2)
     
-    terminal_prices = results.mc_price_paths[:, -1]
+    terminal_prices = results.mc_terminal_prices
     col1.metric("Mean Terminal Price", f"${terminal_prices.mean():.2f}")
     col1.metric("Std Dev (Terminal)", f"${terminal_prices.std():.2f}")
     
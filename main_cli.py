@@ -58,7 +58,7 @@ def parse_args() -> argparse.Namespace:
         "--num-steps",
         type=int,
         default=252,
-        help="Number of time steps per simulation (default: 252)",
+        help="Number of time steps per simulation (default: 252; unused, the CLI samples terminal prices directly)",
     )
     
     return parser.parse_args()
@@ -79,6 +79,7 @@ def main() -> None:
         option_type=args.option_type,
         num_simulations=args.num_simulations,
         num_steps=args.num_steps,
+        need_paths=False,
     )
     
     summary = summarize_results(results)
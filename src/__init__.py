@@ -5,8 +5,10 @@ Modules:
 - config: default configuration values for options pricing
 - market_data: fetch real market data for volatility estimation
 - gbm: geometric Brownian motion simulation engine
+- gbm_numba: fused Numba kernel for European option pricing without stored paths
 - options: option payoff calculations
 - black_scholes: analytical Black-Scholes pricing for comparison
+- black_scholes_numba: Numba-compiled Black-Scholes for batch pricing
 - monte_carlo: Monte Carlo simulation engine for option pricing
 - visualizations: plotting utilities for price paths and distributions
 """
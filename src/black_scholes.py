@@ -1,7 +1,15 @@
 from __future__ import annotations
 
-import numpy as np
-from scipy.stats import norm
+from math import erf, exp, log, sqrt
+
+from .options import OptType
+
+_INV_SQRT2 = 0.7071067811865476
+
+
+def _norm_cdf(x: float) -> float:
+    """Standard normal CDF via math.erf (avoids scipy.stats dispatch overhead)."""
+    return 0.5 * (1.0 + erf(x * _INV_SQRT2))
 
 
 def black_scholes_call(S: float, K: float, T: float, r: float, sigma: float) -> float:
@@ -30,10 +38,16 @@ def black_scholes_call(S: float, K: float, T: float, r: float, sigma: float) ->
         # Option has expired
         return max(S - K, 0)
     
-    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-    d2 = d1 - sigma * np.sqrt(T)
+    sigma_sqrt_T = sigma * sqrt(T)
+    if sigma_sqrt_T <= 0 or S <= 0:
+        # Deterministic limit (no volatility or a worthless stock):
+        # the price is the discounted intrinsic value
+        return max(S - K * exp(-r * T), 0.0)
+    
+    d1 = (log(S / K) + (r + 0.5 * sigma**2) * T) / sigma_sqrt_T
+    d2 = d1 - sigma_sqrt_T
     
-    call_price = S * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
+    call_price = S * _norm_cdf(d1) - K * exp(-r * T) * _norm_cdf(d2)
     return float(call_price)
 
 
@@ -63,10 +77,16 @@ def black_scholes_put(S: float, K: float, T: float, r: float, sigma: float) -> f
         # Option has expired
         return max(K - S, 0)
     
-    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-    d2 = d1 - sigma * np.sqrt(T)
+    sigma_sqrt_T = sigma * sqrt(T)
+    if sigma_sqrt_T <= 0 or S <= 0:
+        # Deterministic limit (no volatility or a worthless stock):
+        # the price is the discounted intrinsic value
+        return max(K * exp(-r * T) - S, 0.0)
+    
+    d1 = (log(S / K) + (r + 0.5 * sigma**2) * T) / sigma_sqrt_T
+    d2 = d1 - sigma_sqrt_T
     
-    put_price = K * np.exp(-r * T) * norm.cdf(-d2) - S * norm.cdf(-d1)
+    put_price = K * exp(-r * T) * _norm_cdf(-d2) - S * _norm_cdf(-d1)
     return float(put_price)
 
 
@@ -76,7 +96,7 @@ def black_scholes_price(
     T: float,
     r: float,
     sigma: float,
-    option_type: str,
+    option_type: OptType | str,
 ) -> float:
     """
     Calculate European option price using Black-Scholes formula.
@@ -93,17 +113,14 @@ def black_scholes_price(
         Risk-free interest rate (annualized).
     sigma : float
         Volatility (annualized standard deviation).
-    option_type : str
-        "call" or "put".
+    option_type : OptType or str
+        OptType.CALL / OptType.PUT, or "call" / "put".
         
     Returns
     -------
     float
         Option price.
     """
-    if option_type.lower() == "call":
+    if OptType.parse(option_type) is OptType.CALL:
         return black_scholes_call(S, K, T, r, sigma)
-    elif option_type.lower() == "put":
-        return black_scholes_put(S, K, T, r, sigma)
-    else:
-        raise ValueError(f"Unknown option type: {option_type}. Use 'call' or 'put'.")
+    return black_scholes_put(S, K, T, r, sigma)
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(fastmath=True, cache=True)
+def _norm_cdf(x: float) -> float:
+    return 0.5 * (1.0 + math.erf(x * 0.7071067811865476))
+
+
+@njit(fastmath=True, cache=True)
+def bs_call(S: float, K: float, T: float, r: float, sigma: float) -> float:
+    """
+    Numba-compiled European call price using the Black-Scholes formula.
+
+    Parameters
+    ----------
+    S : float
+        Current stock price.
+    K : float
+        Strike price.
+    T : float
+        Time to expiration in years.
+    r : float
+        Risk-free interest rate (annualized).
+    sigma : float
+        Volatility (annualized standard deviation).
+
+    Returns
+    -------
+    float
+        Call option price.
+    """
+    if T <= 0.0:
+        return max(S - K, 0.0)
+
+    sigma_sqrt_T = sigma * math.sqrt(T)
+    if sigma_sqrt_T <= 0.0 or S <= 0.0:
+        # Deterministic limit: discounted intrinsic value
+        return max(S - K * math.exp(-r * T), 0.0)
+
+    d1 = (math.log(S / K) + (r + 0.5 * sigma * sigma) * T) / sigma_sqrt_T
+    d2 = d1 - sigma_sqrt_T
+    return S * _norm_cdf(d1) - K * math.exp(-r * T) * _norm_cdf(d2)
+
+
+@njit(fastmath=True, cache=True)
+def bs_put(S: float, K: float, T: float, r: float, sigma: float) -> float:
+    """
+    Numba-compiled European put price using the Black-Scholes formula.
+
+    Parameters
+    ----------
+    S : float
+        Current stock price.
+    K : float
+        Strike price.
+    T : float
+        Time to expiration in years.
+    r : float
+        Risk-free interest rate (annualized).
+    sigma : float
+        Volatility (annualized standard deviation).
+
+    Returns
+    -------
+    float
+        Put option price.
+    """
+    if T <= 0.0:
+        return max(K - S, 0.0)
+
+    sigma_sqrt_T = sigma * math.sqrt(T)
+    if sigma_sqrt_T <= 0.0 or S <= 0.0:
+        # Deterministic limit: discounted intrinsic value
+        return max(K * math.exp(-r * T) - S, 0.0)
+
+    d1 = (math.log(S / K) + (r + 0.5 * sigma * sigma) * T) / sigma_sqrt_T
+    d2 = d1 - sigma_sqrt_T
+    return K * math.exp(-r * T) * _norm_cdf(-d2) - S * _norm_cdf(-d1)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def bs_call_vec(
+    S: np.ndarray,
+    K: np.ndarray,
+    T: np.ndarray,
+    r: np.ndarray,
+    sigma: np.ndarray,
+) -> np.ndarray:
+    """
+    Price a batch of European calls in parallel (e.g. for IV surfaces or Greek grids).
+
+    All inputs must be 1D float arrays of the same length.
+
+    Returns
+    -------
+    np.ndarray
+        Call option prices, one per input row.
+    """
+    out = np.empty(S.shape[0])
+    for i in prange(S.shape[0]):
+        out[i] = bs_call(S[i], K[i], T[i], r[i], sigma[i])
+    return out
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def bs_put_vec(
+    S: np.ndarray,
+    K: np.ndarray,
+    T: np.ndarray,
+    r: np.ndarray,
+    sigma: np.ndarray,
+) -> np.ndarray:
+    """
+    Price a batch of European puts in parallel (e.g. for IV surfaces or Greek grids).
+
+    All inputs must be 1D float arrays of the same length.
+
+    Returns
+    -------
+    np.ndarray
+        Put option prices, one per input row.
+    """
+    out = np.empty(S.shape[0])
+    for i in prange(S.shape[0]):
+        out[i] = bs_put(S[i], K[i], T[i], r[i], sigma[i])
+    return out
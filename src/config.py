@@ -21,6 +21,7 @@ class DefaultConfig:
     # Monte Carlo parameters
     num_simulations: int = 10000  # Number of price paths to simulate
     num_steps: int = 252  # Number of time steps (trading days in a year)
+    num_display_paths: int = 100  # Full-resolution paths kept for plotting
     
     # Market data for volatility estimation
     ticker: str = "AAPL"
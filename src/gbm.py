@@ -1,6 +1,44 @@
 from __future__ import annotations
 
+import math
+
 import numpy as np
+from scipy.special import ndtri
+from scipy.stats import qmc
+
+
+def _standard_normals(
+    num_samples: int,
+    dim: int,
+    rng: np.random.Generator,
+    antithetic: bool = False,
+    use_qmc: bool = False,
+) -> np.ndarray:
+    """
+    Draw a (num_samples, dim) float32 array of standard normals.
+    
+    With ``antithetic`` the first half of the rows is mirrored into the second.
+    With ``use_qmc`` the draws come from a scrambled Sobol sequence mapped
+    through the inverse normal CDF (``scipy.special.ndtri``) instead of
+    pseudo-random sampling; mirroring Z is then the same as pairing U with
+    1 - U, so the inverse CDF is only evaluated for half the points. Sobol
+    points are only balanced in power-of-two counts; other counts take the
+    first ``num_samples`` points of the next power of two.
+    """
+    n = (num_samples + 1) // 2 if antithetic else num_samples
+    
+    if use_qmc:
+        engine = qmc.Sobol(d=dim, scramble=True, seed=rng)
+        m = max(int(np.ceil(np.log2(max(n, 1)))), 0)
+        U = engine.random_base2(m=m)[:n]
+        Z = ndtri(U).astype(np.float32)
+    else:
+        Z = rng.standard_normal((n, dim), dtype=np.float32)
+    
+    if antithetic:
+        Z = np.concatenate([Z, -Z], axis=0)[:num_samples]
+    
+    return Z
 
 
 def simulate_gbm_paths(
@@ -11,6 +49,9 @@ def simulate_gbm_paths(
     num_steps: int,
     num_simulations: int,
     random_seed: int | None = None,
+    rng: np.random.Generator | None = None,
+    antithetic: bool = False,
+    use_qmc: bool = False,
 ) -> np.ndarray:
     """
     Simulate stock price paths using Geometric Brownian Motion (GBM).
@@ -39,31 +80,201 @@ def simulate_gbm_paths(
     num_simulations : int
         Number of price paths to generate.
     random_seed : int, optional
-        Random seed for reproducibility.
+        Random seed for reproducibility. Ignored if ``rng`` is provided.
+    rng : np.random.Generator, optional
+        Random number generator to draw from. Defaults to a new PCG64
+        generator seeded with ``random_seed``.
+    antithetic : bool
+        If True, draw normals for half the paths and mirror them (Z, -Z)
+        for the other half (antithetic variates).
+    use_qmc : bool
+        If True, drive the paths with a scrambled Sobol sequence
+        (quasi-Monte Carlo, one dimension per time step).
         
     Returns
     -------
     np.ndarray
-        Array of shape (num_simulations, num_steps + 1) containing simulated price paths.
-        Each row is one simulated path, starting with S0.
+        float32 array of shape (num_simulations, num_steps + 1) containing simulated
+        price paths. Each row is one simulated path, starting with S0.
     """
-    if random_seed is not None:
-        np.random.seed(random_seed)
+    if rng is None:
+        rng = np.random.default_rng(random_seed)
     
-    dt = T / num_steps
-    
-    # Initialize price paths array
-    paths = np.zeros((num_simulations, num_steps + 1))
-    paths[:, 0] = S0
+    # The path tensor is float32: sampling error (~1/sqrt(N)) dominates
+    # float32 rounding, and half-width elements halve memory traffic.
+    dt = np.float32(T / num_steps)
     
     # Generate random normal increments
-    Z = np.random.standard_normal((num_simulations, num_steps))
+    Z = _standard_normals(num_simulations, num_steps, rng, antithetic, use_qmc)
+    
+    # Simulate paths in log space using the exact solution of GBM:
+    # log S(t) = log S0 + sum of (mu - 0.5 * sigma^2) * dt + sigma * sqrt(dt) * Z
+    # Scalars are hoisted and Z is scaled in place into log increments,
+    # so no (num_simulations, num_steps) temporaries are allocated.
+    drift = np.float32(mu - 0.5 * sigma * sigma) * dt
+    vol = np.float32(sigma * math.sqrt(dt))
+    np.multiply(Z, vol, out=Z)
+    np.add(Z, drift, out=Z)
+    
+    log_paths = np.empty((num_simulations, num_steps + 1), dtype=np.float32)
+    log_paths[:, 0] = 0.0
+    np.cumsum(Z, axis=1, out=log_paths[:, 1:])
     
-    # Simulate paths using the exact solution of GBM:
-    # S(t + dt) = S(t) * exp((mu - 0.5 * sigma^2) * dt + sigma * sqrt(dt) * Z)
-    for t in range(1, num_steps + 1):
-        paths[:, t] = paths[:, t - 1] * np.exp(
-            (mu - 0.5 * sigma**2) * dt + sigma * np.sqrt(dt) * Z[:, t - 1]
-        )
+    paths = np.exp(log_paths, out=log_paths)
+    paths *= np.float32(S0)
     
     return paths
+
+
+def simulate_gbm_terminal(
+    S0: float,
+    mu: float,
+    sigma: float,
+    T: float,
+    num_simulations: int,
+    random_seed: int | None = None,
+    rng: np.random.Generator | None = None,
+    antithetic: bool = False,
+    use_qmc: bool = False,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Sample terminal stock prices of Geometric Brownian Motion directly.
+    
+    The terminal price is exactly lognormal:
+        S(T) = S0 * exp((mu - 0.5 * sigma^2) * T + sigma * sqrt(T) * Z)
+    so one normal draw per path has the same distribution as the step-wise
+    scheme in ``simulate_gbm_paths`` without materializing intermediate steps.
+    
+    Parameters
+    ----------
+    S0 : float
+        Initial stock price.
+    mu : float
+        Drift rate (expected return, typically risk-free rate for risk-neutral pricing).
+    sigma : float
+        Volatility (annualized standard deviation).
+    T : float
+        Time to expiration in years.
+    num_simulations : int
+        Number of terminal prices to generate.
+    random_seed : int, optional
+        Random seed for reproducibility. Ignored if ``rng`` is provided.
+    rng : np.random.Generator, optional
+        Random number generator to draw from. Defaults to a new PCG64
+        generator seeded with ``random_seed``.
+    antithetic : bool
+        If True, draw normals for half the samples and mirror them (Z, -Z)
+        for the other half (antithetic variates).
+    use_qmc : bool
+        If True, use a one-dimensional scrambled Sobol sequence (quasi-Monte Carlo).
+    out : np.ndarray, optional
+        float32 buffer of shape (num_simulations,) to write the prices into.
+        
+    Returns
+    -------
+    np.ndarray
+        float32 array of shape (num_simulations,) containing terminal prices.
+    """
+    if rng is None:
+        rng = np.random.default_rng(random_seed)
+    
+    Z = _standard_normals(num_simulations, 1, rng, antithetic, use_qmc)[:, 0]
+    
+    drift = np.float32((mu - 0.5 * sigma * sigma) * T)
+    vol = np.float32(sigma * math.sqrt(T))
+    
+    Z *= vol
+    Z += drift
+    np.exp(Z, out=Z)
+    
+    return np.multiply(Z, np.float32(S0), out=out)
+
+
+def simulate_gbm_paths_sample(
+    S0: float,
+    mu: float,
+    sigma: float,
+    T: float,
+    num_steps: int,
+    num_simulations: int,
+    num_sample_paths: int = 100,
+    random_seed: int | None = None,
+    antithetic: bool = False,
+    use_qmc: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Simulate a small sample of full GBM paths plus terminal prices for all paths.
+    
+    Only ``num_sample_paths`` paths are simulated step-wise; the terminal prices
+    of the remaining paths are sampled directly with ``simulate_gbm_terminal``
+    on an independent ``SeedSequence`` stream and written straight into the
+    terminal price array.
+    
+    With ``use_qmc`` all ``num_simulations`` terminal prices come from one
+    Sobol sequence, so a power-of-two count stays balanced; the sample paths
+    are then drawn separately and are for display only.
+    
+    Parameters
+    ----------
+    S0 : float
+        Initial stock price.
+    mu : float
+        Drift rate (expected return, typically risk-free rate for risk-neutral pricing).
+    sigma : float
+        Volatility (annualized standard deviation).
+    T : float
+        Time to expiration in years.
+    num_steps : int
+        Number of time steps for the sample paths.
+    num_simulations : int
+        Total number of simulated paths.
+    num_sample_paths : int
+        Number of paths simulated at full resolution.
+    random_seed : int, optional
+        Random seed for reproducibility.
+    antithetic : bool
+        If True, use antithetic variates in both streams.
+    use_qmc : bool
+        If True, use scrambled Sobol sequences in both streams.
+        
+    Returns
+    -------
+    sample_paths : np.ndarray
+        float32 array of shape (min(num_sample_paths, num_simulations), num_steps + 1).
+    terminal_prices : np.ndarray
+        float32 array of shape (num_simulations,); without ``use_qmc`` the
+        first rows are the terminal values of ``sample_paths``.
+    """
+    num_sample_paths = min(num_sample_paths, num_simulations)
+    path_seq, terminal_seq = np.random.SeedSequence(random_seed).spawn(2)
+    
+    sample_paths = simulate_gbm_paths(
+        S0=S0,
+        mu=mu,
+        sigma=sigma,
+        T=T,
+        num_steps=num_steps,
+        num_simulations=num_sample_paths,
+        rng=np.random.default_rng(path_seq),
+        antithetic=antithetic,
+        use_qmc=use_qmc,
+    )
+    
+    # Sobol points must not be split, so QMC samples every terminal price
+    num_reused = 0 if use_qmc else num_sample_paths
+    terminal_prices = np.empty(num_simulations, dtype=np.float32)
+    terminal_prices[:num_reused] = sample_paths[:num_reused, -1]
+    simulate_gbm_terminal(
+        S0=S0,
+        mu=mu,
+        sigma=sigma,
+        T=T,
+        num_simulations=num_simulations - num_reused,
+        rng=np.random.default_rng(terminal_seq),
+        antithetic=antithetic,
+        use_qmc=use_qmc,
+        out=terminal_prices[num_reused:],
+    )
+    
+    return sample_paths, terminal_prices
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from numba import njit, prange
+
+# Paths are split into this many blocks, each with its own seeded RNG stream.
+# Numba keeps one RNG state per thread, so seeding per block (rather than once
+# on the calling thread) makes results depend only on the seed.
+NUM_BLOCKS = 64
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _mc_european_kernel(
+    S0: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float,
+    num_steps: int,
+    num_simulations: int,
+    block_seeds: np.ndarray,
+    is_call: bool,
+) -> float:
+    dt = T / num_steps
+    drift = (r - 0.5 * sigma * sigma) * dt
+    vol = sigma * math.sqrt(dt)
+
+    block_size = (num_simulations + NUM_BLOCKS - 1) // NUM_BLOCKS
+    block_sums = np.zeros(NUM_BLOCKS)
+    for b in prange(NUM_BLOCKS):
+        np.random.seed(block_seeds[b])
+        acc = 0.0
+        for _ in range(b * block_size, min((b + 1) * block_size, num_simulations)):
+            x = 0.0
+            for _ in range(num_steps):
+                x += drift + vol * np.random.standard_normal()
+            ST = S0 * math.exp(x)
+            if is_call:
+                acc += max(ST - K, 0.0)
+            else:
+                acc += max(K - ST, 0.0)
+        block_sums[b] = acc
+
+    # Serial sum; block_sums.sum() would become a parallel reduction
+    total = 0.0
+    for b in range(NUM_BLOCKS):
+        total += block_sums[b]
+
+    return math.exp(-r * T) * total / num_simulations
+
+
+def mc_european(
+    S0: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float,
+    num_steps: int,
+    num_simulations: int,
+    seed: int | None,
+    is_call: bool,
+) -> float:
+    """
+    Price a European option with a fused GBM path + payoff Numba kernel.
+
+    Each path accumulates its log-price in a scalar across all time steps,
+    so the (num_simulations, num_steps + 1) path matrix is never materialized.
+    Paths are split into ``NUM_BLOCKS`` blocks that run in parallel. Each block
+    seeds its thread's generator with its own entry of
+    ``SeedSequence(seed).generate_state(NUM_BLOCKS)`` and simulates its paths
+    serially, and the block sums are added in a fixed order.
+
+    Parameters
+    ----------
+    S0 : float
+        Current stock price.
+    K : float
+        Strike price.
+    T : float
+        Time to expiration in years.
+    r : float
+        Risk-free interest rate (annualized), used as risk-neutral drift.
+    sigma : float
+        Volatility (annualized standard deviation).
+    num_steps : int
+        Number of time steps per simulation.
+    num_simulations : int
+        Number of Monte Carlo simulations.
+    seed : int or None
+        Random seed; None draws fresh entropy. Results are reproducible for
+        any number of Numba threads, and different seeds give independent
+        block streams.
+    is_call : bool
+        True for a call option, False for a put.
+
+    Returns
+    -------
+    float
+        Estimated option price.
+    """
+    block_seeds = np.random.SeedSequence(seed).generate_state(NUM_BLOCKS)
+    return _mc_european_kernel(
+        S0, K, T, r, sigma, num_steps, num_simulations, block_seeds, is_call
+    )
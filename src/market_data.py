@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import functools
+import math
 from datetime import date
+from pathlib import Path
 
 import numpy as np
 import pandas as pd
 import yfinance as yf
 
+# On-disk cache for downloaded price history
+CACHE_DIR = Path.home() / ".cache" / "mc-options"
 
+
+@functools.lru_cache(maxsize=64)
 def fetch_price_history(
     ticker: str,
     start: date,
@@ -15,6 +22,10 @@ def fetch_price_history(
     """
     Fetch historical price data using yfinance.
     
+    Results are cached in-process and on disk under ``CACHE_DIR``, keyed on
+    ticker, date range and interval, so repeat calls skip the download.
+    The returned DataFrame is shared between callers and must not be mutated.
+    
     Parameters
     ----------
     ticker : str
@@ -29,11 +40,16 @@ def fetch_price_history(
     pd.DataFrame
         Historical OHLCV data.
     """
+    interval = "1d"
+    cache_path = CACHE_DIR / f"{ticker}_{start.isoformat()}_{end.isoformat()}_{interval}.pkl"
+    if cache_path.exists():
+        return pd.read_pickle(cache_path)
+    
     df = yf.download(
         ticker,
         start=start.isoformat(),
         end=end.isoformat(),
-        interval="1d",
+        interval=interval,
         auto_adjust=False,
         progress=False,
     )
@@ -41,7 +57,10 @@ def fetch_price_history(
     if df.empty:
         raise ValueError(f"No data returned for ticker {ticker}.")
     
-    return df.sort_index()
+    df = df.sort_index()
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    df.to_pickle(cache_path)
+    return df
 
 
 def estimate_volatility(prices: pd.Series, annualization_factor: int = 252) -> float:
@@ -60,9 +79,12 @@ def estimate_volatility(prices: pd.Series, annualization_factor: int = 252) -> f
     float
         Annualized volatility (standard deviation of log returns).
     """
-    log_returns = np.log(prices / prices.shift(1)).dropna()
-    daily_volatility = log_returns.std()
-    annualized_volatility = daily_volatility * np.sqrt(annualization_factor)
+    # ravel() also handles single-column DataFrames returned by yfinance
+    log_prices = np.log(np.asarray(prices, dtype=np.float64).ravel())
+    log_returns = np.diff(log_prices)
+    # Missing prices (yfinance can return NaN rows) yield NaN returns; skip them
+    daily_volatility = np.nanstd(log_returns, ddof=1)
+    annualized_volatility = daily_volatility * math.sqrt(annualization_factor)
     return float(annualized_volatility)
 
 
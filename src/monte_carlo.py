@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
-from .gbm import simulate_gbm_paths
-from .options import calculate_option_payoff
+from .gbm import simulate_gbm_paths, simulate_gbm_paths_sample, simulate_gbm_terminal
+from .options import OptType, calculate_option_payoff
 
 
 def monte_carlo_option_price(
@@ -12,19 +16,25 @@ def monte_carlo_option_price(
     T: float,
     r: float,
     sigma: float,
-    option_type: str,
+    option_type: OptType | str,
     num_simulations: int = 10000,
     num_steps: int = 252,
     random_seed: int | None = None,
-) -> tuple[float, np.ndarray, np.ndarray]:
+    antithetic: bool = False,
+    num_display_paths: int = 100,
+    use_qmc: bool = False,
+) -> tuple[float, np.ndarray, np.ndarray, np.ndarray]:
     """
     Price a European option using Monte Carlo simulation with Geometric Brownian Motion.
     
     Process:
-    1. Simulate stock price paths using GBM
-    2. Calculate option payoff for each terminal price
-    3. Average all payoffs
-    4. Discount back to present value
+    1. Simulate a small set of full GBM paths for display
+    2. Sample the remaining terminal prices directly from the lognormal law
+    3. Calculate option payoff for each terminal price
+    4. Average all payoffs and discount back to present value
+    
+    Only ``num_display_paths`` paths are stored at full resolution, so memory
+    stays O(num_simulations + num_display_paths * num_steps).
     
     Parameters
     ----------
@@ -38,39 +48,50 @@ def monte_carlo_option_price(
         Risk-free interest rate (annualized).
     sigma : float
         Volatility (annualized standard deviation).
-    option_type : str
-        "call" or "put".
+    option_type : OptType or str
+        OptType.CALL / OptType.PUT, or "call" / "put".
     num_simulations : int
         Number of Monte Carlo simulations.
     num_steps : int
         Number of time steps per simulation.
     random_seed : int, optional
         Random seed for reproducibility.
+    antithetic : bool
+        If True, use antithetic variates: half the paths are driven by Z
+        and the other half by -Z, reducing the variance of the estimate.
+    num_display_paths : int
+        Number of paths simulated step-wise and returned for plotting.
+    use_qmc : bool
+        If True, use scrambled Sobol quasi-random numbers instead of
+        pseudo-random normals.
         
     Returns
     -------
     option_price : float
         Estimated option price.
-    price_paths : np.ndarray
-        Simulated stock price paths (shape: num_simulations x num_steps+1).
+    sample_paths : np.ndarray
+        Simulated stock price paths for display
+        (shape: min(num_display_paths, num_simulations) x num_steps+1).
+    terminal_prices : np.ndarray
+        Terminal stock prices of all simulations (shape: num_simulations).
     payoffs : np.ndarray
         Option payoffs for each simulation (shape: num_simulations).
     """
-    # Simulate stock price paths using GBM
+    # Simulate display paths step-wise and the remaining terminal prices directly
     # Use risk-free rate as drift for risk-neutral pricing
-    price_paths = simulate_gbm_paths(
+    sample_paths, terminal_prices = simulate_gbm_paths_sample(
         S0=S0,
         mu=r,  # Risk-neutral drift
         sigma=sigma,
         T=T,
         num_steps=num_steps,
         num_simulations=num_simulations,
+        num_sample_paths=num_display_paths,
         random_seed=random_seed,
+        antithetic=antithetic,
+        use_qmc=use_qmc,
     )
     
-    # Extract terminal prices (last column)
-    terminal_prices = price_paths[:, -1]
-    
     # Calculate option payoffs
     payoffs = calculate_option_payoff(terminal_prices, K, option_type)
     
@@ -78,38 +99,87 @@ def monte_carlo_option_price(
     average_payoff = np.mean(payoffs)
     option_price = average_payoff * np.exp(-r * T)
     
-    return float(option_price), price_paths, payoffs
+    return float(option_price), sample_paths, terminal_prices, payoffs
 
 
-def calculate_monte_carlo_stats(payoffs: np.ndarray, r: float, T: float) -> dict[str, float]:
+def monte_carlo_european_terminal(
+    S0: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float,
+    option_type: OptType | str,
+    num_simulations: int = 10000,
+    random_seed: int | None = None,
+    use_qmc: bool = False,
+) -> tuple[float, np.ndarray, np.ndarray]:
     """
-    Calculate statistics for Monte Carlo option pricing.
+    Price a European option by sampling terminal prices directly.
+    
+    Under GBM the terminal price is exactly lognormal:
+        S_T = S0 * exp((r - 0.5 * sigma^2) * T + sigma * sqrt(T) * Z)
+    so a single normal draw per path gives the same distribution as the
+    step-wise scheme. Use this when intermediate path values are not needed.
     
     Parameters
     ----------
-    payoffs : np.ndarray
-        Array of option payoffs from simulations.
-    r : float
-        Risk-free rate.
+    S0 : float
+        Current stock price.
+    K : float
+        Strike price.
     T : float
         Time to expiration in years.
+    r : float
+        Risk-free interest rate (annualized).
+    sigma : float
+        Volatility (annualized standard deviation).
+    option_type : OptType or str
+        OptType.CALL / OptType.PUT, or "call" / "put".
+    num_simulations : int
+        Number of Monte Carlo simulations.
+    random_seed : int, optional
+        Random seed for reproducibility.
+    use_qmc : bool
+        If True, use a scrambled Sobol sequence instead of pseudo-random normals.
         
     Returns
     -------
-    dict
-        Statistics including mean, std, confidence interval, etc.
+    option_price : float
+        Estimated option price.
+    terminal_prices : np.ndarray
+        Simulated terminal stock prices (shape: num_simulations).
+    payoffs : np.ndarray
+        Option payoffs for each simulation (shape: num_simulations).
     """
-    discount_factor = np.exp(-r * T)
+    # Use risk-free rate as drift for risk-neutral pricing
+    terminal_prices = simulate_gbm_terminal(
+        S0=S0,
+        mu=r,
+        sigma=sigma,
+        T=T,
+        num_simulations=num_simulations,
+        random_seed=random_seed,
+        use_qmc=use_qmc,
+    )
+    
+    payoffs = calculate_option_payoff(terminal_prices, K, option_type)
+    option_price = np.mean(payoffs) * np.exp(-r * T)
     
-    mean_payoff = np.mean(payoffs)
-    std_payoff = np.std(payoffs)
+    return float(option_price), terminal_prices, payoffs
+
+
+def _stats_from_moments(
+    n: int, mean_payoff: float, std_payoff: float, r: float, T: float
+) -> dict[str, float]:
+    """Build the Monte Carlo statistics dict from payoff count, mean and std."""
+    discount_factor = np.exp(-r * T)
     
     # Present value statistics
     pv_mean = mean_payoff * discount_factor
     pv_std = std_payoff * discount_factor
     
     # 95% confidence interval for the option price estimate
-    standard_error = pv_std / np.sqrt(len(payoffs))
+    standard_error = pv_std / np.sqrt(n)
     ci_lower = pv_mean - 1.96 * standard_error
     ci_upper = pv_mean + 1.96 * standard_error
     
@@ -120,5 +190,242 @@ def calculate_monte_carlo_stats(payoffs: np.ndarray, r: float, T: float) -> dict
         "std_error": float(standard_error),
         "ci_lower": float(ci_lower),
         "ci_upper": float(ci_upper),
-        "num_simulations": len(payoffs),
+        "num_simulations": n,
     }
+
+
+def _merge_moments(
+    n_a: int, mean_a: float, m2_a: float, n_b: int, mean_b: float, m2_b: float
+) -> tuple[int, float, float]:
+    """Combine (count, mean, M2) of two batches (Chan et al. parallel Welford update)."""
+    n = n_a + n_b
+    if n == 0:
+        return 0, 0.0, 0.0
+    delta = mean_b - mean_a
+    mean = mean_a + delta * n_b / n
+    m2 = m2_a + m2_b + delta * delta * n_a * n_b / n
+    return n, mean, m2
+
+
+def _mc_chunked(
+    S0: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float,
+    option_type: OptType | str,
+    num_simulations: int,
+    num_steps: int,
+    rng: np.random.Generator,
+    antithetic: bool = False,
+    chunk: int = 8192,
+) -> tuple[int, float, float, np.ndarray]:
+    """
+    Simulate GBM paths in row chunks and reduce payoffs without storing all paths.
+    
+    Returns (count, mean payoff, M2 of payoffs, paths of the first chunk).
+    """
+    n, mean, m2 = 0, 0.0, 0.0
+    first_paths = None
+    
+    for start in range(0, num_simulations, chunk):
+        size = min(chunk, num_simulations - start)
+        paths = simulate_gbm_paths(
+            S0=S0,
+            mu=r,  # Risk-neutral drift
+            sigma=sigma,
+            T=T,
+            num_steps=num_steps,
+            num_simulations=size,
+            rng=rng,
+            antithetic=antithetic,
+        )
+        if first_paths is None:
+            first_paths = paths
+        
+        payoffs = calculate_option_payoff(paths[:, -1], K, option_type).astype(np.float64)
+        chunk_mean = payoffs.mean()
+        chunk_m2 = np.sum((payoffs - chunk_mean) ** 2)
+        n, mean, m2 = _merge_moments(n, mean, m2, size, chunk_mean, chunk_m2)
+    
+    return n, mean, m2, first_paths
+
+
+def _parallel_mc(
+    S0: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float,
+    option_type: OptType | str,
+    num_simulations: int,
+    num_steps: int,
+    random_seed: int | None = None,
+    antithetic: bool = False,
+    chunk: int = 8192,
+    workers: int | None = None,
+) -> tuple[int, float, float, np.ndarray]:
+    """
+    Run ``_mc_chunked`` on row blocks across a thread pool and merge the moments.
+    
+    NumPy's RNG, exp and cumsum kernels release the GIL, so threads overlap.
+    Each worker gets its own stream from ``SeedSequence.spawn`` to guarantee
+    statistically independent samples.
+    """
+    workers = workers or os.cpu_count() or 1
+    workers = max(1, min(workers, num_simulations))
+    
+    seeds = np.random.SeedSequence(random_seed).spawn(workers)
+    base, extra = divmod(num_simulations, workers)
+    sizes = [base + (i < extra) for i in range(workers)]
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _mc_chunked,
+                S0=S0,
+                K=K,
+                T=T,
+                r=r,
+                sigma=sigma,
+                option_type=option_type,
+                num_simulations=size,
+                num_steps=num_steps,
+                rng=np.random.default_rng(seed),
+                antithetic=antithetic,
+                chunk=chunk,
+            )
+            for size, seed in zip(sizes, seeds)
+        ]
+        results = [future.result() for future in futures]
+    
+    n, mean, m2 = 0, 0.0, 0.0
+    for n_i, mean_i, m2_i, _ in results:
+        n, mean, m2 = _merge_moments(n, mean, m2, n_i, mean_i, m2_i)
+    
+    return n, mean, m2, results[0][3]
+
+
+def monte_carlo_stats_streaming(
+    S0: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float,
+    option_type: OptType | str,
+    num_simulations: int = 10000,
+    num_steps: int = 252,
+    random_seed: int | None = None,
+    antithetic: bool = False,
+    chunk_size: int = 8192,
+    workers: int | None = 1,
+) -> tuple[dict[str, float], np.ndarray]:
+    """
+    Price a European option with full step-wise GBM paths in bounded memory.
+    
+    Paths are simulated ``chunk_size`` rows at a time and reduced to running
+    payoff moments, so peak memory is O(chunk_size * num_steps) rather than
+    O(num_simulations * num_steps).
+    
+    Parameters
+    ----------
+    S0 : float
+        Current stock price.
+    K : float
+        Strike price.
+    T : float
+        Time to expiration in years.
+    r : float
+        Risk-free interest rate (annualized).
+    sigma : float
+        Volatility (annualized standard deviation).
+    option_type : OptType or str
+        OptType.CALL / OptType.PUT, or "call" / "put".
+    num_simulations : int
+        Number of Monte Carlo simulations.
+    num_steps : int
+        Number of time steps per simulation.
+    random_seed : int, optional
+        Random seed for reproducibility.
+    antithetic : bool
+        If True, use antithetic variates within each chunk.
+    chunk_size : int
+        Number of paths simulated per chunk.
+    workers : int, optional
+        Number of worker threads. None uses all CPU cores; with more than one
+        worker each gets an independent RNG stream.
+        
+    Returns
+    -------
+    stats : dict
+        Statistics in the same format as ``calculate_monte_carlo_stats``.
+    sample_paths : np.ndarray
+        Paths of the first chunk, for plotting.
+    """
+    if num_simulations < 1:
+        raise ValueError(f"num_simulations must be at least 1, got {num_simulations}.")
+    
+    if workers == 1:
+        n, mean_payoff, m2, sample_paths = _mc_chunked(
+            S0=S0,
+            K=K,
+            T=T,
+            r=r,
+            sigma=sigma,
+            option_type=option_type,
+            num_simulations=num_simulations,
+            num_steps=num_steps,
+            rng=np.random.default_rng(random_seed),
+            antithetic=antithetic,
+            chunk=chunk_size,
+        )
+    else:
+        n, mean_payoff, m2, sample_paths = _parallel_mc(
+            S0=S0,
+            K=K,
+            T=T,
+            r=r,
+            sigma=sigma,
+            option_type=option_type,
+            num_simulations=num_simulations,
+            num_steps=num_steps,
+            random_seed=random_seed,
+            antithetic=antithetic,
+            chunk=chunk_size,
+            workers=workers,
+        )
+    std_payoff = np.sqrt(m2 / n)
+    return _stats_from_moments(n, mean_payoff, std_payoff, r, T), sample_paths
+
+
+def calculate_monte_carlo_stats(payoffs: np.ndarray, r: float, T: float) -> dict[str, float]:
+    """
+    Calculate statistics for Monte Carlo option pricing.
+    
+    Parameters
+    ----------
+    payoffs : np.ndarray
+        Array of option payoffs from simulations.
+    r : float
+        Risk-free rate.
+    T : float
+        Time to expiration in years.
+        
+    Returns
+    -------
+    dict
+        Statistics including mean, std, confidence interval, etc.
+    """
+    # Single pass for the first two moments: sum plus a BLAS dot product.
+    # Both are accumulated in float64; s2/n - mean^2 amplifies any rounding
+    # in the sum of squares, which float32 payoffs would otherwise carry.
+    n = payoffs.size
+    payoffs64 = np.asarray(payoffs, dtype=np.float64)
+    payoff_sum = payoffs64.sum()
+    payoff_sq_sum = float(np.dot(payoffs64, payoffs64))
+    
+    mean_payoff = payoff_sum / n
+    variance = payoff_sq_sum / n - mean_payoff * mean_payoff
+    std_payoff = math.sqrt(max(variance, 0.0))
+    
+    return _stats_from_moments(n, mean_payoff, std_payoff, r, T)
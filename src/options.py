@@ -1,9 +1,39 @@
 from __future__ import annotations
 
+from enum import IntEnum
+
 import numpy as np
 
 
-def call_payoff(spot_prices: np.ndarray, strike: float) -> np.ndarray:
+class OptType(IntEnum):
+    """Option type, parsed once at the pipeline entry instead of per call."""
+    
+    CALL = 0
+    PUT = 1
+    
+    @classmethod
+    def parse(cls, option_type: OptType | str) -> OptType:
+        """
+        Normalize "call"/"put" (any case) or an existing OptType to an OptType.
+        
+        Raises
+        ------
+        ValueError
+            If the option type is not recognized.
+        """
+        if isinstance(option_type, cls):
+            return option_type
+        try:
+            return cls[option_type.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown option type: {option_type}. Use 'call' or 'put'.") from None
+
+
+def call_payoff(
+    spot_prices: np.ndarray,
+    strike: float,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
     """
     Calculate call option payoff at expiration.
     
@@ -15,16 +45,31 @@ def call_payoff(spot_prices: np.ndarray, strike: float) -> np.ndarray:
         Terminal stock prices (at expiration).
     strike : float
         Strike price.
+    out : np.ndarray, optional
+        Preallocated output buffer to reuse across calls (e.g. strike sweeps).
         
     Returns
     -------
     np.ndarray
         Call option payoffs.
     """
-    return np.maximum(spot_prices - strike, 0)
+    if out is None:
+        out = np.empty_like(spot_prices, dtype=np.result_type(spot_prices.dtype, np.float32))
+    
+    # Every path finishes out of the money: skip the elementwise work
+    if spot_prices.size and spot_prices.max() <= strike:
+        out.fill(0)
+        return out
+    
+    np.subtract(spot_prices, strike, out=out)
+    return np.maximum(out, 0, out=out)
 
 
-def put_payoff(spot_prices: np.ndarray, strike: float) -> np.ndarray:
+def put_payoff(
+    spot_prices: np.ndarray,
+    strike: float,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
     """
     Calculate put option payoff at expiration.
     
@@ -36,19 +81,31 @@ def put_payoff(spot_prices: np.ndarray, strike: float) -> np.ndarray:
         Terminal stock prices (at expiration).
     strike : float
         Strike price.
+    out : np.ndarray, optional
+        Preallocated output buffer to reuse across calls (e.g. strike sweeps).
         
     Returns
     -------
     np.ndarray
         Put option payoffs.
     """
-    return np.maximum(strike - spot_prices, 0)
+    if out is None:
+        out = np.empty_like(spot_prices, dtype=np.result_type(spot_prices.dtype, np.float32))
+    
+    # Every path finishes out of the money: skip the elementwise work
+    if spot_prices.size and spot_prices.min() >= strike:
+        out.fill(0)
+        return out
+    
+    np.subtract(strike, spot_prices, out=out)
+    return np.maximum(out, 0, out=out)
 
 
 def calculate_option_payoff(
     terminal_prices: np.ndarray,
     strike: float,
-    option_type: str,
+    option_type: OptType | str,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     """
     Calculate option payoffs for a given option type.
@@ -59,17 +116,16 @@ def calculate_option_payoff(
         Array of terminal stock prices.
     strike : float
         Strike price.
-    option_type : str
-        "call" or "put".
+    option_type : OptType or str
+        OptType.CALL / OptType.PUT, or "call" / "put".
+    out : np.ndarray, optional
+        Preallocated output buffer for the payoffs.
         
     Returns
     -------
     np.ndarray
         Array of option payoffs.
     """
-    if option_type.lower() == "call":
-        return call_payoff(terminal_prices, strike)
-    elif option_type.lower() == "put":
-        return put_payoff(terminal_prices, strike)
-    else:
-        raise ValueError(f"Unknown option type: {option_type}. Use 'call' or 'put'.")
+    if OptType.parse(option_type) is OptType.CALL:
+        return call_payoff(terminal_prices, strike, out=out)
+    return put_payoff(terminal_prices, strike, out=out)
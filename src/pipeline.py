@@ -6,7 +6,12 @@ import numpy as np
 
 from .black_scholes import black_scholes_price
 from .config import DefaultConfig
-from .monte_carlo import calculate_monte_carlo_stats, monte_carlo_option_price
+from .monte_carlo import (
+    calculate_monte_carlo_stats,
+    monte_carlo_european_terminal,
+    monte_carlo_option_price,
+)
+from .options import OptType
 
 
 @dataclass
@@ -24,7 +29,8 @@ class OptionPricingResults:
     
     # Monte Carlo results
     mc_price: float
-    mc_price_paths: np.ndarray
+    mc_sample_paths: np.ndarray | None
+    mc_terminal_prices: np.ndarray
     mc_payoffs: np.ndarray
     mc_std_error: float
     mc_ci_lower: float
@@ -36,6 +42,9 @@ class OptionPricingResults:
     # Comparison
     price_difference: float
     percentage_difference: float
+    
+    # Sampling method; the i.i.d. standard error and CI do not apply to QMC
+    use_qmc: bool = False
 
 
 def price_option_monte_carlo(
@@ -47,6 +56,9 @@ def price_option_monte_carlo(
     option_type: str | None = None,
     num_simulations: int | None = None,
     num_steps: int | None = None,
+    need_paths: bool = True,
+    num_display_paths: int | None = None,
+    use_qmc: bool = False,
 ) -> OptionPricingResults:
     """
     Price an option using Monte Carlo simulation and compare with Black-Scholes.
@@ -69,6 +81,15 @@ def price_option_monte_carlo(
         Number of Monte Carlo simulations.
     num_steps : int, optional
         Number of time steps per simulation.
+    need_paths : bool
+        If False, sample terminal prices directly instead of simulating full
+        paths; ``mc_sample_paths`` is then None. Use when nothing is plotted.
+    num_display_paths : int, optional
+        Number of full-resolution paths kept in ``mc_sample_paths`` for plotting.
+    use_qmc : bool
+        If True, use Sobol quasi-Monte Carlo sampling instead of pseudo-random draws.
+        ``num_simulations`` is rounded up to a power of two, which keeps the
+        Sobol points balanced.
         
     Returns
     -------
@@ -83,22 +104,42 @@ def price_option_monte_carlo(
     T = time_to_expiration if time_to_expiration is not None else cfg.time_to_expiration
     r = risk_free_rate if risk_free_rate is not None else cfg.risk_free_rate
     sigma = volatility if volatility is not None else cfg.volatility
-    opt_type = option_type if option_type is not None else cfg.option_type
+    opt_type = OptType.parse(option_type if option_type is not None else cfg.option_type)
     n_sims = num_simulations if num_simulations is not None else cfg.num_simulations
     n_steps = num_steps if num_steps is not None else cfg.num_steps
+    n_display = num_display_paths if num_display_paths is not None else cfg.num_display_paths
+    
+    if use_qmc:
+        n_sims = 1 << (n_sims - 1).bit_length()
     
     # Monte Carlo pricing
-    mc_price, price_paths, payoffs = monte_carlo_option_price(
-        S0=S0,
-        K=K,
-        T=T,
-        r=r,
-        sigma=sigma,
-        option_type=opt_type,
-        num_simulations=n_sims,
-        num_steps=n_steps,
-        random_seed=42,
-    )
+    if need_paths:
+        mc_price, sample_paths, terminal_prices, payoffs = monte_carlo_option_price(
+            S0=S0,
+            K=K,
+            T=T,
+            r=r,
+            sigma=sigma,
+            option_type=opt_type,
+            num_simulations=n_sims,
+            num_steps=n_steps,
+            random_seed=42,
+            num_display_paths=n_display,
+            use_qmc=use_qmc,
+        )
+    else:
+        mc_price, terminal_prices, payoffs = monte_carlo_european_terminal(
+            S0=S0,
+            K=K,
+            T=T,
+            r=r,
+            sigma=sigma,
+            option_type=opt_type,
+            num_simulations=n_sims,
+            random_seed=42,
+            use_qmc=use_qmc,
+        )
+        sample_paths = None
     
     # Calculate Monte Carlo statistics
     mc_stats = calculate_monte_carlo_stats(payoffs, r, T)
@@ -116,10 +157,11 @@ def price_option_monte_carlo(
         time_to_expiration=T,
         risk_free_rate=r,
         volatility=sigma,
-        option_type=opt_type,
+        option_type=opt_type.name.lower(),
         num_simulations=n_sims,
         mc_price=mc_price,
-        mc_price_paths=price_paths,
+        mc_sample_paths=sample_paths,
+        mc_terminal_prices=terminal_prices,
         mc_payoffs=payoffs,
         mc_std_error=mc_stats["std_error"],
         mc_ci_lower=mc_stats["ci_lower"],
@@ -127,6 +169,7 @@ def price_option_monte_carlo(
         bs_price=bs_price,
         price_difference=price_diff,
         percentage_difference=pct_diff,
+        use_qmc=use_qmc,
     )
 
 
@@ -162,8 +205,16 @@ def summarize_results(results: OptionPricingResults) -> str:
         "",
         "Monte Carlo Results:",
         f"  Estimated Price:       ${results.mc_price:.4f}",
-        f"  Standard Error:        ${results.mc_std_error:.4f}",
-        f"  95% Confidence Interval: [${results.mc_ci_lower:.4f}, ${results.mc_ci_upper:.4f}]",
+    ]
+    if results.use_qmc:
+        # A single scrambled Sobol sequence has no i.i.d. error estimate
+        lines.append("  Standard Error:        n/a (quasi-Monte Carlo)")
+    else:
+        lines += [
+            f"  Standard Error:        ${results.mc_std_error:.4f}",
+            f"  95% Confidence Interval: [${results.mc_ci_lower:.4f}, ${results.mc_ci_upper:.4f}]",
+        ]
+    lines += [
         "",
         "Black-Scholes Results:",
         f"  Theoretical Price:     ${results.bs_price:.4f}",
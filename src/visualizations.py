@@ -1,8 +1,207 @@
 from __future__ import annotations
 
-import matplotlib.pyplot as plt
+import functools
+import math
+from typing import TYPE_CHECKING, Literal
+
 import numpy as np
-import seaborn as sns
+from numba import njit, prange
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+
+def _rgba(r: int, g: int, b: int) -> tuple[float, float, float, float]:
+    return (r / 255, g / 255, b / 255, 1.0)
+
+
+# Named colors as RGBA tuples, so no color-string parsing happens per artist
+# and matplotlib is not needed at import time
+_STEELBLUE = _rgba(70, 130, 180)
+_RED = _rgba(255, 0, 0)
+_GREEN = _rgba(0, 128, 0)
+_CORAL = _rgba(255, 127, 80)
+_DARKBLUE = _rgba(0, 0, 139)
+_NAVY = _rgba(0, 0, 128)
+_BLACK = _rgba(0, 0, 0)
+_WHEAT = _rgba(245, 222, 179)
+
+# Above this many samples the KDE switches from the exact sum to FFT binning
+_DIRECT_KDE_MAX_SAMPLES = 100_000
+
+# The KDE curve is fitted on at most this many samples (no visible difference beyond)
+_KDE_MAX_SAMPLES = 200_000
+
+# Larger float64 inputs are downcast to float32 before binning and KDE passes
+_FLOAT32_MIN_SAMPLES = 100_000
+
+
+@functools.lru_cache(maxsize=None)
+def _pyplot():
+    """
+    Import pyplot on first use.
+    
+    The backend is left to the caller; the Streamlit app selects Agg itself.
+    """
+    import matplotlib.pyplot as plt
+    
+    return plt
+
+
+@functools.lru_cache(maxsize=32)
+def _time_grid(T: float, num_points: int) -> np.ndarray:
+    """Read-only time grid from 0 to T, cached across repeated plots."""
+    grid = np.linspace(0, T, num_points)
+    grid.setflags(write=False)
+    return grid
+
+
+def _plot_dtype(x: np.ndarray) -> np.ndarray:
+    """
+    Downcast large float64 arrays to float32 for plotting.
+    
+    The histogram, mean and KDE passes are memory-bound and the rendered
+    result has far less than float32 resolution, so half-width elements are
+    enough. The numba kernels accumulate in float64 either way.
+    """
+    x = np.asarray(x)
+    if x.dtype == np.float64 and x.size > _FLOAT32_MIN_SAMPLES:
+        return x.astype(np.float32)
+    return x
+
+
+@njit(cache=True)
+def _hist_mean_kernel(x: np.ndarray, bins: int, lo: float, hi: float) -> tuple[np.ndarray, float]:
+    counts = np.zeros(bins, dtype=np.int64)
+    scale = bins / (hi - lo)
+    total = 0.0
+    for v in x:
+        total += v
+        if lo <= v <= hi:
+            i = int((v - lo) * scale)
+            if i == bins:  # right edge is inclusive, as in np.histogram
+                i -= 1
+            counts[i] += 1
+    return counts, total / x.size
+
+
+def _hist_and_mean(
+    x: np.ndarray,
+    bins: int = 50,
+    range: tuple[float, float] | None = None,
+) -> tuple[np.ndarray, np.ndarray, float]:
+    """
+    Equal-width histogram and mean of ``x`` from one fused pass over the data.
+    
+    The mean covers all of ``x``, including values outside ``range``.
+    
+    Returns
+    -------
+    counts : np.ndarray
+        Number of samples per bin.
+    edges : np.ndarray
+        Bin edges (length bins + 1).
+    mean : float
+        Mean of ``x``.
+    """
+    lo, hi = (float(x.min()), float(x.max())) if range is None else range
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5
+    counts, mean = _hist_mean_kernel(x, bins, lo, hi)
+    return counts, np.linspace(lo, hi, bins + 1), float(mean)
+
+
+def _histogram(
+    x: np.ndarray,
+    bins: int = 50,
+    range: tuple[float, float] | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Equal-width histogram of ``x`` as ``(counts, edges)``.
+    
+    The result can be passed as ``hist`` to the distribution plots to skip
+    re-binning when the same array is plotted more than once.
+    """
+    counts, edges, _ = _hist_and_mean(x, bins=bins, range=range)
+    return counts, edges
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _gauss_kde_1d(samples: np.ndarray, grid: np.ndarray, h: float) -> np.ndarray:
+    """Direct Gaussian KDE sum at each grid point, parallel over the grid with O(1) extra memory."""
+    density = np.empty(grid.shape[0])
+    inv_h = 1.0 / h
+    norm = 1.0 / (samples.size * h * math.sqrt(2.0 * math.pi))
+    for i in prange(grid.shape[0]):
+        g = grid[i]
+        acc = 0.0
+        for j in range(samples.size):
+            z = (g - samples[j]) * inv_h
+            acc += math.exp(-0.5 * z * z)
+        density[i] = acc * norm
+    return density
+
+
+def _binned_kde(
+    samples: np.ndarray,
+    h: float,
+    num_points: int = 1024,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Gaussian KDE evaluated on a regular grid by binning and FFT convolution.
+    
+    Costs O(N + M log M) for N samples and M grid points instead of the
+    O(N * M) direct sum.
+    """
+    from scipy.signal import fftconvolve
+    
+    n = samples.size
+    
+    # Pad the grid by 3 bandwidths so the tails are not cut off
+    lo = float(np.min(samples)) - 3 * h
+    hi = float(np.max(samples)) + 3 * h
+    counts, edges = np.histogram(samples, bins=num_points, range=(lo, hi))
+    grid = 0.5 * (edges[:-1] + edges[1:])
+    dx = edges[1] - edges[0]
+    
+    # Gaussian kernel sampled on the same spacing, truncated at 4 bandwidths
+    half_width = int(np.ceil(4 * h / dx))
+    offsets = np.arange(-half_width, half_width + 1) * dx
+    kernel = np.exp(-0.5 * (offsets / h) ** 2) / (h * np.sqrt(2 * np.pi))
+    
+    density = fftconvolve(counts, kernel, mode="same") / n
+    return grid, density
+
+
+def _gaussian_kde(samples: np.ndarray, num_points: int = 256) -> tuple[np.ndarray, np.ndarray]:
+    """
+    1D Gaussian KDE with Silverman's rule-of-thumb bandwidth.
+    
+    Evaluates the exact kernel sum for up to ``_DIRECT_KDE_MAX_SAMPLES`` samples
+    and switches to the FFT-binned approximation above that.
+    
+    Parameters
+    ----------
+    samples : np.ndarray
+        1D sample array.
+    num_points : int
+        Number of grid points for the direct evaluation.
+        
+    Returns
+    -------
+    grid : np.ndarray
+        Grid of evaluation points.
+    density : np.ndarray
+        Estimated density at each grid point.
+    """
+    n = samples.size
+    h = 1.06 * float(np.std(samples)) * n ** (-1 / 5)
+    
+    if n > _DIRECT_KDE_MAX_SAMPLES:
+        return _binned_kde(samples, h)
+    
+    grid = np.linspace(float(np.min(samples)) - 3 * h, float(np.max(samples)) + 3 * h, num_points)
+    return grid, _gauss_kde_1d(samples, grid, h)
 
 
 def plot_price_paths(
@@ -13,6 +212,8 @@ def plot_price_paths(
     num_paths_to_plot: int = 100,
     title: str = "Simulated Stock Price Paths (GBM)",
     figsize: tuple[int, int] = (12, 6),
+    mode: Literal["paths", "bands"] = "paths",
+    ax: plt.Axes | None = None,
 ) -> plt.Figure:
     """
     Plot a sample of simulated stock price paths.
@@ -20,7 +221,7 @@ def plot_price_paths(
     Parameters
     ----------
     price_paths : np.ndarray
-        Array of simulated price paths (shape: num_simulations x num_steps+1).
+        Array of simulated price paths (shape: num_paths x num_steps+1).
     S0 : float
         Initial stock price.
     K : float
@@ -28,38 +229,79 @@ def plot_price_paths(
     T : float
         Time to expiration in years.
     num_paths_to_plot : int
-        Number of paths to plot (randomly sampled).
+        Number of paths to plot (randomly sampled). Ignored in "bands" mode.
     title : str
         Plot title.
     figsize : tuple
         Figure size.
+    mode : {"paths", "bands"}
+        "paths" draws individual sampled paths; "bands" draws the median path
+        and the 5th-95th percentile band across all paths, which stays cheap
+        to render for any number of paths.
+    ax : plt.Axes, optional
+        Existing axes to draw into (``figsize`` is then ignored). Pass a
+        pre-created axes when plotting repeatedly to avoid building a new
+        figure on every call.
         
     Returns
     -------
     plt.Figure
         Matplotlib figure object.
     """
-    fig, ax = plt.subplots(figsize=figsize)
+    if ax is None:
+        fig, ax = _pyplot().subplots(figsize=figsize)
+    else:
+        fig = ax.figure
     
-    num_simulations, num_steps = price_paths.shape
-    time_grid = np.linspace(0, T, num_steps)
+    num_simulations, num_points = price_paths.shape
+    time_grid = _time_grid(T, num_points)
     
-    # Randomly sample paths to plot
-    indices = np.random.choice(num_simulations, min(num_paths_to_plot, num_simulations), replace=False)
+    # Labeled artists are collected so the legend skips scanning the axes
+    legend_handles = []
     
-    for idx in indices:
-        ax.plot(time_grid, price_paths[idx, :], alpha=0.3, linewidth=0.8, color="steelblue")
+    if mode == "bands":
+        # Summarize before plotting: one filled polygon and one line
+        lo, med, hi = np.percentile(price_paths, [5, 50, 95], axis=0)
+        band = ax.fill_between(time_grid, lo, hi, alpha=0.3, color=_STEELBLUE, label="5th-95th Percentile")
+        (median_line,) = ax.plot(time_grid, med, color=_NAVY, linewidth=1.5, label="Median Path")
+        legend_handles += [band, median_line]
+    else:
+        # Randomly sample paths to plot; sorted indices give a cache-friendly gather.
+        # Generator.choice samples k of n in O(k) instead of permuting all n indices.
+        rng = np.random.default_rng()
+        indices = np.sort(
+            rng.choice(num_simulations, min(num_paths_to_plot, num_simulations), replace=False)
+        )
+        
+        from matplotlib.collections import LineCollection
+        
+        # Draw all sampled paths as a single artist instead of one Line2D per path.
+        # float32 segments are plenty for pixel-level rendering.
+        segments = np.empty((len(indices), num_points, 2), dtype=np.float32)
+        segments[..., 0] = time_grid[None, :]
+        segments[..., 1] = price_paths[indices, :]
+        paths_collection = LineCollection(segments, colors=_STEELBLUE, linewidths=0.8, alpha=0.3)
+        # Rasterize the many overlapping paths into one bitmap in vector exports
+        # (PDF/SVG); the reference lines below stay vector and crisp.
+        paths_collection.set_rasterized(True)
+        paths_collection.set_zorder(0)
+        ax.add_collection(paths_collection)
+        ax.autoscale_view()
     
-    # Plot strike price
-    ax.axhline(K, color="red", linestyle="--", linewidth=2, label=f"Strike Price K={K}")
+    from matplotlib.lines import Line2D
     
-    # Plot initial price
-    ax.axhline(S0, color="green", linestyle="--", linewidth=2, label=f"Initial Price S0={S0}")
+    # Strike and initial price as one LineCollection; the collection carries a
+    # single style, so the legend gets a Line2D proxy per reference line
+    ax.hlines([K, S0], 0, T, colors=[_RED, _GREEN], linestyles="--", linewidth=2)
+    legend_handles += [
+        Line2D([], [], color=_RED, linestyle="--", linewidth=2, label=f"Strike Price K={K}"),
+        Line2D([], [], color=_GREEN, linestyle="--", linewidth=2, label=f"Initial Price S0={S0}"),
+    ]
     
     ax.set_xlabel("Time (years)", fontsize=12)
     ax.set_ylabel("Stock Price", fontsize=12)
     ax.set_title(title, fontsize=14, fontweight="bold")
-    ax.legend()
+    ax.legend(handles=legend_handles)
     ax.grid(True, alpha=0.3)
     
     return fig
@@ -72,6 +314,8 @@ def plot_payoff_distribution(
     option_type: str = "call",
     title: str = "Option Payoff Distribution",
     figsize: tuple[int, int] = (10, 6),
+    ax: plt.Axes | None = None,
+    hist: tuple[np.ndarray, np.ndarray] | None = None,
 ) -> plt.Figure:
     """
     Plot histogram of option payoffs from Monte Carlo simulation.
@@ -90,26 +334,50 @@ def plot_payoff_distribution(
         Plot title.
     figsize : tuple
         Figure size.
+    ax : plt.Axes, optional
+        Existing axes to draw into (``figsize`` is then ignored). Pass a
+        pre-created axes when plotting repeatedly to avoid building a new
+        figure on every call.
+    hist : tuple of np.ndarray, optional
+        Precomputed ``(counts, edges)`` from ``_histogram``; the data is then
+        not binned again.
         
     Returns
     -------
     plt.Figure
         Matplotlib figure object.
     """
-    fig, ax = plt.subplots(figsize=figsize)
+    payoffs = _plot_dtype(payoffs)
+    
+    if ax is None:
+        fig, ax = _pyplot().subplots(figsize=figsize)
+    else:
+        fig = ax.figure
+    
+    if hist is None:
+        # Payoffs are heavily right-skewed: clip the binning range at the 99.5th
+        # percentile (O(N) selection via np.partition) so bins are not mostly empty
+        k = int(0.995 * (payoffs.size - 1))
+        hi = float(np.partition(payoffs, k)[k])
+        if hi <= 0.0:
+            # Under 0.5% of paths finish in the money; keep them all in range
+            hi = float(payoffs.max())
+        counts, edges, mean_payoff = _hist_and_mean(payoffs, bins=50, range=(0.0, hi))
+    else:
+        counts, edges = hist
+        mean_payoff = float(np.mean(payoffs, dtype=np.float64))
     
-    # Histogram of payoffs
-    ax.hist(payoffs, bins=50, alpha=0.7, color="coral", edgecolor="black", density=False)
+    # Histogram of payoffs drawn as a single step patch
+    ax.stairs(counts, edges, fill=True, alpha=0.7, facecolor=_CORAL, edgecolor=_BLACK)
     
     # Mean payoff line
-    mean_payoff = np.mean(payoffs)
-    ax.axvline(mean_payoff, color="darkblue", linestyle="--", linewidth=2, 
-               label=f"Mean Payoff: ${mean_payoff:.2f}")
+    mean_line = ax.axvline(mean_payoff, color=_DARKBLUE, linestyle="--", linewidth=2, 
+                           label=f"Mean Payoff: ${mean_payoff:.2f}")
     
     ax.set_xlabel("Option Payoff at Expiration", fontsize=12)
     ax.set_ylabel("Frequency", fontsize=12)
     ax.set_title(title, fontsize=14, fontweight="bold")
-    ax.legend()
+    ax.legend(handles=[mean_line])
     ax.grid(True, alpha=0.3)
     
     # Add text box with pricing info
@@ -122,25 +390,27 @@ def plot_payoff_distribution(
     
     ax.text(0.98, 0.97, info_text, transform=ax.transAxes,
             fontsize=10, verticalalignment='top', horizontalalignment='right',
-            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
+            bbox=dict(boxstyle='round', facecolor=_WHEAT, alpha=0.5))
     
     return fig
 
 
 def plot_terminal_price_distribution(
-    price_paths: np.ndarray,
+    terminal_prices: np.ndarray,
     K: float,
     option_type: str = "call",
     title: str = "Terminal Stock Price Distribution",
     figsize: tuple[int, int] = (10, 6),
+    ax: plt.Axes | None = None,
+    hist: tuple[np.ndarray, np.ndarray] | None = None,
 ) -> plt.Figure:
     """
     Plot distribution of terminal stock prices with strike price.
     
     Parameters
     ----------
-    price_paths : np.ndarray
-        Simulated price paths.
+    terminal_prices : np.ndarray
+        Simulated terminal stock prices (shape: num_simulations).
     K : float
         Strike price.
     option_type : str
@@ -149,34 +419,66 @@ def plot_terminal_price_distribution(
         Plot title.
     figsize : tuple
         Figure size.
+    ax : plt.Axes, optional
+        Existing axes to draw into (``figsize`` is then ignored). Pass a
+        pre-created axes when plotting repeatedly to avoid building a new
+        figure on every call.
+    hist : tuple of np.ndarray, optional
+        Precomputed ``(counts, edges)`` from ``_histogram``; the data is then
+        not binned again.
         
     Returns
     -------
     plt.Figure
         Matplotlib figure object.
     """
-    fig, ax = plt.subplots(figsize=figsize)
+    terminal_prices = _plot_dtype(terminal_prices)
+    
+    if ax is None:
+        fig, ax = _pyplot().subplots(figsize=figsize)
+    else:
+        fig = ax.figure
+    
+    if hist is None:
+        counts, edges, mean_terminal = _hist_and_mean(terminal_prices, bins=50)
+    else:
+        counts, edges = hist
+        mean_terminal = float(np.mean(terminal_prices, dtype=np.float64))
     
-    terminal_prices = price_paths[:, -1]
+    # Density histogram drawn as a single step patch
+    density = counts / (counts.sum() * np.diff(edges))
+    ax.stairs(density, edges, fill=True, alpha=0.7, facecolor=_STEELBLUE, edgecolor=_BLACK)
     
-    # Histogram
-    ax.hist(terminal_prices, bins=50, alpha=0.7, color="steelblue", edgecolor="black", density=True)
+    # Labeled artists are collected so the legend skips scanning the axes
+    legend_handles = []
     
     # KDE overlay
-    sns.kdeplot(terminal_prices, ax=ax, color="darkblue", linewidth=2, label="KDE")
+    if np.ptp(terminal_prices) > 0:
+        # Subsample for the KDE only; the histogram and mean use every sample
+        if terminal_prices.size > _KDE_MAX_SAMPLES:
+            rng = np.random.default_rng()
+            kde_samples = terminal_prices[rng.choice(terminal_prices.size, _KDE_MAX_SAMPLES, replace=False)]
+        else:
+            kde_samples = terminal_prices
+        kde_grid, kde_density = _gaussian_kde(kde_samples)
+        (kde_line,) = ax.plot(kde_grid, kde_density, color=_DARKBLUE, linewidth=2, label="KDE")
+        legend_handles.append(kde_line)
     
     # Strike price
-    ax.axvline(K, color="red", linestyle="--", linewidth=2, label=f"Strike K={K}")
+    legend_handles.append(
+        ax.axvline(K, color=_RED, linestyle="--", linewidth=2, label=f"Strike K={K}")
+    )
     
     # Mean terminal price
-    mean_terminal = np.mean(terminal_prices)
-    ax.axvline(mean_terminal, color="green", linestyle="--", linewidth=2, 
-               label=f"Mean S_T={mean_terminal:.2f}")
+    legend_handles.append(
+        ax.axvline(mean_terminal, color=_GREEN, linestyle="--", linewidth=2,
+                   label=f"Mean S_T={mean_terminal:.2f}")
+    )
     
     ax.set_xlabel("Terminal Stock Price", fontsize=12)
     ax.set_ylabel("Density", fontsize=12)
     ax.set_title(title, fontsize=14, fontweight="bold")
-    ax.legend()
+    ax.legend(handles=legend_handles)
     ax.grid(True, alpha=0.3)
     
     return fig